@@ -12,6 +12,7 @@ Bedrock & Oraxen Pack Generator v2.8
           ├─ textures/models/armor/*.png
           └─ attachables/<id>/<piece>.json
       custom_mappings/auto_mapping.json
+      .pack_state.json  (build reproductible : namespace, hash + version du pack)
       oraxen/items/*.yml  +  oraxen/pack/textures/*.png
 
       Les docs et wiki
@@ -27,31 +28,57 @@ Bedrock & Oraxen Pack Generator v2.8
 Dépendances :
     pip install pyyaml pillow
     (optionnel : pip install matplotlib  -> aperçu 3D)
+
+Les dépendances lourdes (tkinter, pillow, pyyaml, matplotlib) sont
+importées à la demande : importer ce module pour utiliser PackBuilder
+depuis un script ne charge que la bibliothèque standard.
 """
 # ---------------------------------------------------------------- imports
-import json, shutil, uuid, sys, tkinter as tk, yaml
+from __future__ import annotations
+
+import json, shutil, uuid, hashlib, importlib.util
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Dict
-from tkinter import ttk, filedialog, simpledialog, messagebox
 
-try:
-    from PIL import Image
-except ImportError:
-    print("⚠ pillow est requis :  pip install pillow")
-    sys.exit(1)
+# tkinter : chargé par _load_tk() (GUI uniquement)
+tk = ttk = filedialog = simpledialog = messagebox = None
 
-# ---------------------------------------------------------------- aperçu 3D (facultatif)
-try:
-    import matplotlib.pyplot as plt
-    from mpl_toolkits.mplot3d import Axes3D  # noqa
-    HAS_MPL = True
-except ImportError:
-    HAS_MPL = False
 
+def _load_tk():
+    global tk, ttk, filedialog, simpledialog, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, filedialog as _fd, \
+            simpledialog as _sd, messagebox as _mb
+        tk, ttk, filedialog, simpledialog, messagebox = (
+            tkinter, _ttk, _fd, _sd, _mb)
+
+
+def _load_pil():
+    try:
+        from PIL import Image
+    except ImportError as ex:
+        raise ImportError(
+            "pillow est requis :  pip install pillow") from ex
+    return Image
+
+# ---------------------------------------------------------------- constantes
+PACK_NAME = "auto_generated_pack"
+# état du build reproductible : namespace du pack, hash, version
+STATE_FILE = ".pack_state.json"
+# dossiers générés, vidés avant un build reproductible
+BEDROCK_GENERATED_DIRS = ("textures/items", "textures/models/armor",
+                          "attachables")
+ORAXEN_GENERATED_DIRS = ("items", "pack/textures")
 
+# ---------------------------------------------------------------- aperçu 3D (facultatif)
 def preview_cube(path: Path, title="Preview"):
-    if not HAS_MPL:
+    try:
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D  # noqa
+    except ImportError:
+        _load_tk()
         messagebox.showinfo("Aperçu indisponible",
                             "Installe pillow + matplotlib pour l’aperçu 3D.")
         return
@@ -77,7 +104,7 @@ def preview_cube(path: Path, title="Preview"):
 def convert_java_armor_to_bedrock(src: Path, dst: Path):
     """Bedrock accepte déjà les PNG 64×32 layer_1 / layer_2 : simple copie."""
     try:
-        img = Image.open(src).convert("RGBA")
+        img = _load_pil().open(src).convert("RGBA")
     except FileNotFoundError:
         print(f"[WARN] overlay manquant : {src}")
         return
@@ -138,15 +165,21 @@ class PackEntry:
 # ---------------------------------------------------------------- PackBuilder
 class PackBuilder:
     def __init__(self, entries: List[PackEntry], out: Path,
-                 skip_oraxen: bool = False):
+                 skip_oraxen: bool = False, reproducible: bool = False):
         """
-        :param entries:     objets à traiter
-        :param out:         dossier de sortie
-        :param skip_oraxen: True → on NE régénère PAS oraxen/
+        :param entries:      objets à traiter
+        :param out:          dossier de sortie
+        :param skip_oraxen:  True → on NE régénère PAS oraxen/
+        :param reproducible: True → UUID stables (namespace propre au
+                             pack, gardé dans .pack_state.json), version
+                             incrémentée seulement si le contenu change,
+                             JSON trié, dossiers générés vidés
         """
-        self.e = entries
+        self.e = (sorted(entries, key=lambda x: (x.identifier, x.cmd))
+                  if reproducible else entries)
         self.out = out
         self.skip_oraxen = skip_oraxen
+        self.reproducible = reproducible
 
     # ----- helpers dossier
     def _dir(self, *p):
@@ -154,6 +187,76 @@ class PackBuilder:
         d.mkdir(parents=True, exist_ok=True)
         return d
 
+    def _clear(self, root: Path, dirs):
+        """Build reproductible : vide les dossiers générés."""
+        if self.reproducible:
+            for d in dirs:
+                shutil.rmtree(root / d, ignore_errors=True)
+
+    def _dump(self, data) -> str:
+        return json.dumps(data, indent=2, sort_keys=self.reproducible) + (
+            "\n" if self.reproducible else "")
+
+    # ----- identité du pack (uuid / version)
+    @staticmethod
+    def _content_hash(root: Path) -> str:
+        """SHA-256 du pack (chemins triés), manifest exclu."""
+        h = hashlib.sha256()
+        for f in sorted(p for p in root.rglob("*") if p.is_file()):
+            rel = f.relative_to(root).as_posix()
+            if rel == "manifest.json":
+                continue
+            h.update(rel.encode() + b"\0" + f.read_bytes() + b"\0")
+        return h.hexdigest()
+
+    def _pack_state(self, content_hash: str):
+        """
+        Namespace propre au pack (aléatoire au 1er build) + version.
+        Même contenu → même version ; sinon patch + 1.
+        Sans état valide : nouveau namespace, version 1.0.0.
+        """
+        state_p = self.out / STATE_FILE
+        try:
+            state = json.loads(state_p.read_text())
+            namespace = uuid.UUID(state["namespace"])
+            version = [int(v) for v in state["version"]]
+            if len(version) != 3:
+                raise ValueError("version invalide")
+        except (FileNotFoundError, ValueError, KeyError, TypeError,
+                AttributeError):
+            namespace, version = uuid.uuid4(), [1, 0, 0]
+        else:
+            if state.get("content_hash") != content_hash:
+                version[2] += 1
+        state_p.write_text(self._dump({"namespace": str(namespace),
+                                       "content_hash": content_hash,
+                                       "version": version}))
+        return namespace, version
+
+    def _manifest(self, root: Path) -> dict:
+        if self.reproducible:
+            namespace, version = self._pack_state(self._content_hash(root))
+            h_uuid = uuid.uuid5(namespace, "header")
+            m_uuid = uuid.uuid5(namespace, "resources")
+        else:
+            version = [1, 0, 0]
+            h_uuid, m_uuid = uuid.uuid4(), uuid.uuid4()
+        return {
+            "format_version": 2,
+            "header": {
+                "description": "Auto Pack",
+                "name": "Auto Pack",
+                "uuid": str(h_uuid),
+                "version": version,
+                "min_engine_version": [1, 20, 0]
+            },
+            "modules": [{
+                "type": "resources",
+                "uuid": str(m_uuid),
+                "version": version
+            }]
+        }
+
     # ----- mapping armure
     @staticmethod
     def _armor_meta(a_type: str):
@@ -197,32 +300,16 @@ class PackBuilder:
 
         adir = root / "attachables" / e.identifier
         adir.mkdir(parents=True, exist_ok=True)
-        (adir / f"{fname}.json").write_text(json.dumps(data, indent=2))
+        (adir / f"{fname}.json").write_text(self._dump(data))
 
     # ----- pack Bedrock
     def _bedrock(self):
         root = self._dir("bedrock_pack")
+        self._clear(root, BEDROCK_GENERATED_DIRS)
         (root / "textures/items").mkdir(parents=True, exist_ok=True)
 
-        manifest = {
-            "format_version": 2,
-            "header": {
-                "description": "Auto Pack",
-                "name": "Auto Pack",
-                "uuid": str(uuid.uuid4()),
-                "version": [1, 0, 0],
-                "min_engine_version": [1, 20, 0]
-            },
-            "modules": [{
-                "type": "resources",
-                "uuid": str(uuid.uuid4()),
-                "version": [1, 0, 0]
-            }]
-        }
-        (root / "manifest.json").write_text(json.dumps(manifest, indent=2))
-
         atlas = {
-            "resource_pack_name": "auto_generated_pack",
+            "resource_pack_name": PACK_NAME,
             "texture_name": "atlas.items",
             "texture_data": {}
         }
@@ -251,8 +338,9 @@ class PackBuilder:
 
                 self._write_attachable(root, e)
 
-        (root / "textures/item_texture.json").write_text(
-            json.dumps(atlas, indent=2))
+        (root / "textures/item_texture.json").write_text(self._dump(atlas))
+        # manifest en dernier : sa version dépend du contenu écrit
+        (root / "manifest.json").write_text(self._dump(self._manifest(root)))
         return root
 
     # ----- pack Oraxen
@@ -282,6 +370,7 @@ class PackBuilder:
 
     def _oraxen(self):
         root = self._dir("oraxen")
+        self._clear(root, ORAXEN_GENERATED_DIRS)
         tex_dir = self._dir("oraxen", "pack", "textures")
         items_d = self._dir("oraxen", "items")
         for e in self.e:
@@ -303,7 +392,7 @@ class PackBuilder:
                 "texture_size": 16
             })
         p = self._dir("custom_mappings") / "auto_mapping.json"
-        p.write_text(json.dumps(mp, indent=2))
+        p.write_text(self._dump(mp))
         return p
 
     # ----- point d’entrée
@@ -317,12 +406,13 @@ class PackBuilder:
 
 
 # ---------------------------------------------------------------- GUI
-class GeneratorGUI(ttk.Frame):
+class GeneratorGUI:
     ARMOR_TYPES = ("helmet", "chestplate", "leggings", "boots")
 
     def __init__(self, root: tk.Tk):
-        super().__init__(root)
-        self.pack(fill="both", expand=True)
+        _load_tk()
+        self.frame = ttk.Frame(root)
+        self.frame.pack(fill="both", expand=True)
         ttk.Style().theme_use("clam")
         root.title("Pack Generator v2.8")
         root.minsize(820, 620)
@@ -347,7 +437,8 @@ class GeneratorGUI(ttk.Frame):
 
     # ---------- UI
     def _build_ui(self):
-        left, right = ttk.Frame(self, padding=10), ttk.Frame(self, padding=10)
+        left = ttk.Frame(self.frame, padding=10)
+        right = ttk.Frame(self.frame, padding=10)
         left.pack(side="left", fill="both", expand=True)
         right.pack(side="right", fill="y")
 
@@ -390,6 +481,13 @@ class GeneratorGUI(ttk.Frame):
                         variable=self.skip_oraxen_var
                         ).pack(anchor="w", pady=(4, 0))
 
+        # option reproducible
+        self.reproducible_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(left,
+                        text="Build reproductible (UUID / version stables)",
+                        variable=self.reproducible_var
+                        ).pack(anchor="w")
+
         ttk.Separator(left).pack(fill="x", pady=6)
         ttk.Label(left, text="Extras (Oraxen)",
                   font=("TkDefaultFont", 10, "bold")).pack(anchor="w")
@@ -580,13 +678,19 @@ class GeneratorGUI(ttk.Frame):
         if not self.entries:
             messagebox.showerror("Erreur", "Liste vide.")
             return
+        # avant toute écriture : pillow sert aux textures d’armure
+        if importlib.util.find_spec("PIL") is None:
+            messagebox.showerror("Erreur",
+                                 "pillow est requis :  pip install pillow")
+            return
 
         out = Path(self.outdir.get())
         out.mkdir(exist_ok=True)
 
         bed, ora, mp = PackBuilder(
             self.entries, out,
-            skip_oraxen=self.skip_oraxen_var.get()
+            skip_oraxen=self.skip_oraxen_var.get(),
+            reproducible=self.reproducible_var.get()
         ).build()
 
         msg = [f"Bedrock pack : {bed}", f"Mapping      : {mp}"]
@@ -596,6 +700,13 @@ class GeneratorGUI(ttk.Frame):
 
     # ---------- import Oraxen
     def _import_oraxen(self):
+        try:
+            import yaml
+        except ImportError:
+            messagebox.showerror("Erreur",
+                                 "pyyaml est requis :  pip install pyyaml")
+            return
+
         root = filedialog.askdirectory(title="Dossier plugins/Oraxen")
         if not root:
             return
@@ -688,6 +799,7 @@ class GeneratorGUI(ttk.Frame):
 
 # ---------------------------------------------------------------- main
 if __name__ == "__main__":
+    _load_tk()
     root = tk.Tk()
     GeneratorGUI(root)
     root.mainloop()
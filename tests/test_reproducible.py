@@ -0,0 +1,114 @@
+"""
+Build reproductible : mêmes entrées → mêmes octets, version incrémentée
+seulement quand le contenu du pack change.
+"""
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import Oraxen_To_Geyser_Converter as conv  # noqa: E402
+
+
+@pytest.fixture
+def textures(tmp_path):
+    tex = tmp_path / "src" / "textures"
+    (tex / "armor").mkdir(parents=True)
+    for name, color in (("sword", "red"), ("gem", "blue")):
+        Image.new("RGBA", (16, 16), color).save(tex / f"{name}.png")
+    for name in ("ruby_helmet", "ruby_layer_1", "ruby_layer_2"):
+        Image.new("RGBA", (64, 32), "green").save(
+            tex / "armor" / f"{name}.png")
+    return tex
+
+
+def _entries(tex: Path):
+    return [
+        conv.PackEntry("sword", "Sword", "DIAMOND_SWORD", 1, "item",
+                       tex / "sword.png"),
+        conv.PackEntry("gem", "Gem", "EMERALD", 2, "item", tex / "gem.png"),
+        conv.PackEntry("ruby_helmet", "Ruby Helmet", "DIAMOND_HELMET", 3,
+                       "armor", tex / "armor" / "ruby_helmet.png",
+                       armor_type="helmet", tex_base="armor/ruby",
+                       overlay_paths=["armor/ruby_layer_1",
+                                      "armor/ruby_layer_2"]),
+    ]
+
+
+def _build(entries, out: Path):
+    return conv.PackBuilder(entries, out, reproducible=True).build()
+
+
+def _tree(out: Path):
+    return {p.relative_to(out).as_posix():
+            hashlib.sha256(p.read_bytes()).hexdigest()
+            for p in sorted(out.rglob("*")) if p.is_file()}
+
+
+def _header(out: Path):
+    m = json.loads((out / "bedrock_pack" / "manifest.json").read_text())
+    return m["header"]["uuid"], m["modules"][0]["uuid"], m["header"]["version"]
+
+
+def test_same_input_is_byte_identical(tmp_path, textures):
+    out = tmp_path / "out"
+    entries = _entries(textures)
+    _build(entries, out)
+    first = _tree(out)
+    _build(list(reversed(entries)), out)
+    assert _tree(out) == first
+
+
+def test_content_change_bumps_patch_keeps_uuids(tmp_path, textures):
+    out = tmp_path / "out"
+    _build(_entries(textures), out)
+    h_uuid, m_uuid, version = _header(out)
+    assert version == [1, 0, 0]
+
+    Image.new("RGBA", (16, 16), "yellow").save(textures / "gem.png")
+    _build(_entries(textures), out)
+    assert _header(out) == (h_uuid, m_uuid, [1, 0, 1])
+
+
+def test_removed_armor_leaves_no_files(tmp_path, textures):
+    out = tmp_path / "out"
+    entries = _entries(textures)
+    _build(entries, out)
+    bed = out / "bedrock_pack"
+    assert (bed / "attachables" / "ruby_helmet").is_dir()
+
+    _build(entries[:2], out)
+    assert not (bed / "attachables" / "ruby_helmet").exists()
+    assert not (bed / "textures/items/ruby_helmet.png").exists()
+    assert not list((bed / "textures").rglob("ruby_layer_*.png"))
+    assert not (out / "oraxen" / "items" / "ruby_helmet.yml").exists()
+    assert not (out / "oraxen" / "pack" / "textures" /
+                "ruby_helmet.png").exists()
+
+
+@pytest.mark.parametrize("state", [
+    "{not json",
+    '{"namespace": "%s", "content_hash": "x", "version": [1, 0]}',
+])
+def test_corrupt_state_starts_fresh_namespace(tmp_path, textures, state):
+    out = tmp_path / "out"
+    _build(_entries(textures), out)
+    state_p = out / conv.STATE_FILE
+    old = json.loads(state_p.read_text())
+    h_uuid, m_uuid, _ = _header(out)
+
+    state_p.write_text(state.replace("%s", old["namespace"]))
+    _build(_entries(textures), out)
+    new = json.loads(state_p.read_text())
+    assert new["namespace"] != old["namespace"]
+    assert new["version"] == [1, 0, 0]
+    new_h, new_m, version = _header(out)
+    assert version == [1, 0, 0]
+    assert new_h != h_uuid and new_m != m_uuid
@@ -0,0 +1,46 @@
+"""
+Garde-fou du temps de démarrage : importer le module (usage script de
+PackBuilder) ne doit charger aucune dépendance lourde.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULE = "Oraxen_To_Geyser_Converter"
+HEAVY = ("tkinter", "PIL", "yaml", "matplotlib")
+# stdlib déjà chargée avant la mesure : seul le coût propre du module
+# (~8 ms) est compté ; yaml ou PIL.Image ajoutent chacun ~20 ms
+STDLIB = "json, shutil, uuid, hashlib, importlib.util, dataclasses, typing"
+# budget cumulé (µs) pour `import Oraxen_To_Geyser_Converter`
+IMPORT_BUDGET_US = 20_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *flags, "-c", code],
+                          cwd=ROOT, capture_output=True, text=True,
+                          check=True)
+
+
+def _cumulative_us(stderr: str) -> int:
+    # lignes : "import time: <self> | <cumulative> | <nom>"
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        if name.strip() == MODULE:
+            return int(cumulative)
+    raise AssertionError(f"{MODULE} absent de la sortie -X importtime")
+
+
+def test_import_time_budget():
+    proc = _run(f"import {STDLIB}\nimport {MODULE}", "-X", "importtime")
+    cumulative = _cumulative_us(proc.stderr)
+    assert cumulative < IMPORT_BUDGET_US, (
+        f"import {MODULE} : {cumulative} µs > {IMPORT_BUDGET_US} µs")
+
+
+def test_no_heavy_imports():
+    proc = _run(f"import sys, {MODULE}\n"
+                f"print(' '.join(m for m in {HEAVY!r} if m in sys.modules))")
+    assert proc.stdout.strip() == ""